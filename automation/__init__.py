@@ -1,4 +1,5 @@
-from typing import Dict, Final
+from types import MappingProxyType
+from typing import Final, Mapping
 
 # ------------------------------------------------------------------------------
 # Alpha Channel
@@ -77,7 +78,9 @@ INTERNAL_RELEASE_OT2_JSON_URL: Final[str] = "https://ot3-development.builds.open
 # URL maps
 # ------------------------------------------------------------------------------
 
-APP_YAML_URLS: Final[Dict[str, str]] = {
+# Frozen read-only views: built once at import, safe to share across modules
+# without defensive copies.
+APP_YAML_URLS: Final[Mapping[str, str]] = MappingProxyType({
     "Alpha (Windows)": ALPHA_APP_WINDOWS_URL,
     "Alpha (Mac)": ALPHA_APP_MAC_URL,
     "Alpha (Linux)": ALPHA_APP_LINUX_URL,
@@ -87,9 +90,9 @@ APP_YAML_URLS: Final[Dict[str, str]] = {
     "Latest (Windows)": LATEST_APP_WINDOWS_URL,
     "Latest (Mac)": LATEST_APP_MAC_URL,
     "Latest (Linux)": LATEST_APP_LINUX_URL,
-}
+})
 
-INTERNAL_APP_YAML_URLS: Final[Dict[str, str]] = {
+INTERNAL_APP_YAML_URLS: Final[Mapping[str, str]] = MappingProxyType({
     "Internal Alpha (Windows)": INTERNAL_ALPHA_APP_WINDOWS_URL,
     "Internal Alpha (Mac)": INTERNAL_ALPHA_APP_MAC_URL,
     "Internal Alpha (Linux)": INTERNAL_ALPHA_APP_LINUX_URL,
@@ -99,14 +102,14 @@ INTERNAL_APP_YAML_URLS: Final[Dict[str, str]] = {
     "Internal Latest (Windows)": INTERNAL_LATEST_APP_WINDOWS_URL,
     "Internal Latest (Mac)": INTERNAL_LATEST_APP_MAC_URL,
     "Internal Latest (Linux)": INTERNAL_LATEST_APP_LINUX_URL,
-}
+})
 
-ROBOT_JSON_URLS: Final[Dict[str, str]] = {
+ROBOT_JSON_URLS: Final[Mapping[str, str]] = MappingProxyType({
     "Flex": RELEASE_FLEX_JSON_URL,
     "OT2": RELEASE_OT2_JSON_URL,
-}
+})
 
-INTERNAL_ROBOT_JSON_URLS: Final[Dict[str, str]] = {
+INTERNAL_ROBOT_JSON_URLS: Final[Mapping[str, str]] = MappingProxyType({
     "Internal Flex": INTERNAL_RELEASE_FLEX_JSON_URL,
     "Internal OT2": INTERNAL_RELEASE_OT2_JSON_URL,
-}
+})
@@ -1,16 +1,174 @@
+import asyncio
+import hashlib
+import json
+import random
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional, Tuple
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
 
 import httpx
 import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml not available; fall back to the pure-Python loader
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 from rich import box
 from rich.console import Console
 from rich.table import Table
 
-from automation.release import AppFile, AppMetadata
+from automation.release import AppMetadata
 
 console = Console()
 
+# All channel manifests live behind the same CloudFront hosts, so one pooled
+# HTTP/2 client can multiplex every fetch over a couple of connections.
+MANIFEST_CLIENT_LIMITS = httpx.Limits(max_connections=10, max_keepalive_connections=10)
+
+
+def app_manifest_client() -> httpx.AsyncClient:
+    """Return a pooled HTTP/2 client for fetching channel manifest YAML."""
+    return httpx.AsyncClient(http2=True, limits=MANIFEST_CLIENT_LIMITS, follow_redirects=True)
+
+
+def top_level_scalars(text: str | bytes, keys: Iterable[str]) -> Dict[str, str]:
+    """Pull selected top-level scalar values from a YAML document via event streaming.
+
+    Skips nested mappings and sequences (for example the per-platform ``files``
+    blocks that dominate updater manifests), so callers that only need a few
+    header fields never build the full document tree. Alias nodes are never
+    resolved: event streaming skips the composer, so aliased values are
+    treated as absent rather than mis-pairing later keys.
+    """
+    wanted = set(keys)
+    found: Dict[str, str] = {}
+    depth = 0
+    current_key: Optional[str] = None
+    for event in yaml.parse(text, Loader=SafeLoader):
+        if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+            depth += 1
+            current_key = None
+        elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+            depth -= 1
+        elif isinstance(event, (yaml.ScalarEvent, yaml.AliasEvent)) and depth == 1:
+            if current_key is None:
+                # An alias in key position still occupies the key slot; the
+                # sentinel keeps pairing aligned and can never match a key.
+                current_key = event.value if isinstance(event, yaml.ScalarEvent) else "\x00alias"
+            else:
+                if isinstance(event, yaml.ScalarEvent) and current_key in wanted:
+                    found[current_key] = event.value
+                current_key = None
+    return found
+
+
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.5
+
+
+async def get_with_retries(
+    client: httpx.AsyncClient,
+    url: str,
+    *,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 10.0,
+    attempts: int = RETRY_ATTEMPTS,
+) -> httpx.Response:
+    """GET with exponential backoff and jitter on transport errors and 5xx responses.
+
+    Retrying in place keeps one flaky CDN response from failing a whole
+    channel and forcing a serial re-run of the command.
+    """
+    for attempt in range(attempts):
+        try:
+            r = await client.get(url, timeout=timeout, headers=headers)
+            if r.status_code < 500 or attempt == attempts - 1:
+                return r
+        except httpx.TransportError:
+            if attempt == attempts - 1:
+                raise
+        await asyncio.sleep(RETRY_BASE_DELAY * 2**attempt + random.uniform(0, RETRY_BASE_DELAY))
+    raise RuntimeError(f"Retries exhausted for {url}")
+
+
+@dataclass
+class CachedManifest:
+    """A previously fetched manifest body with its HTTP validators."""
+
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+
+_manifest_cache: Dict[str, CachedManifest] = {}
+
+# Validators persist on disk so fresh CLI runs still get 304s for unchanged
+# manifests instead of re-downloading every channel.
+MANIFEST_CACHE_DIR = Path.home() / ".cache" / "opentrons-manifest"
+
+
+def _manifest_cache_paths(url: str) -> Tuple[Path, Path]:
+    """Return the (metadata, body) cache file paths for one manifest URL."""
+    digest = hashlib.sha256(url.encode()).hexdigest()[:16]
+    return MANIFEST_CACHE_DIR / f"{digest}.json", MANIFEST_CACHE_DIR / f"{digest}.body"
+
+
+def _load_cached_manifest(url: str) -> Optional[CachedManifest]:
+    """Load a previously persisted manifest body and validators, if any."""
+    meta_path, body_path = _manifest_cache_paths(url)
+    try:
+        meta = json.loads(meta_path.read_text())
+        body = body_path.read_bytes()
+    except (OSError, ValueError):
+        return None
+    return CachedManifest(body=body, etag=meta.get("etag"), last_modified=meta.get("last_modified"))
+
+
+def _store_cached_manifest(url: str, cached: CachedManifest) -> None:
+    """Persist a manifest body and validators; cache writes are best effort."""
+    meta_path, body_path = _manifest_cache_paths(url)
+    try:
+        MANIFEST_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        body_path.write_bytes(cached.body)
+        meta_path.write_text(
+            json.dumps({"url": url, "etag": cached.etag, "last_modified": cached.last_modified})
+        )
+    except OSError:
+        pass
+
+
+async def get_manifest_body(client: httpx.AsyncClient, url: str, timeout: float = 10.0) -> bytes:
+    """GET a manifest with conditional-request validators, reusing the cached body on 304.
+
+    Returns raw bytes; the YAML parser decodes UTF-8 itself, so the response
+    never takes a str round trip.
+    """
+    cached = _manifest_cache.get(url)
+    if cached is None:
+        cached = _load_cached_manifest(url)
+    headers: Dict[str, str] = {}
+    if cached is not None:
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
+    r = await get_with_retries(client, url, timeout=timeout, headers=headers)
+    if r.status_code == 304 and cached is not None:
+        _manifest_cache[url] = cached
+        return cached.body
+    r.raise_for_status()
+    fresh = CachedManifest(
+        body=r.content,
+        etag=r.headers.get("etag"),
+        last_modified=r.headers.get("last-modified"),
+    )
+    _manifest_cache[url] = fresh
+    _store_cached_manifest(url, fresh)
+    return r.content
+
 
 def print_versions_table(versions: List[dict]) -> None:
     """Display versions in a Rich table."""
@@ -34,29 +192,26 @@ def print_versions_table(versions: List[dict]) -> None:
 async def fetch_app_metadata(client: httpx.AsyncClient, label: str, url: str) -> Tuple[str, Optional[AppMetadata], Optional[str]]:
     """Fetch and parse YAML metadata asynchronously, ignoring extra file fields."""
     try:
-        r = await client.get(url, timeout=10.0)
-        r.raise_for_status()
-        data = yaml.safe_load(r.text)
-        files = [
-            AppFile(url=f["url"], sha512=f["sha512"], size=f["size"])
-            for f in data.get("files", [])
-            if "url" in f and "sha512" in f and "size" in f
-        ]
-        meta = AppMetadata(
-            version=data["version"],
-            files=files,
-            path=data["path"],
-            sha512=data["sha512"],
-            releaseNotes=data.get("releaseNotes", ""),
-            releaseDate=data.get("releaseDate"),
-        )
+        body = await get_manifest_body(client, url)
+        meta = AppMetadata.from_manifest(yaml.load(body, Loader=SafeLoader))
         return label, meta, None
     except Exception as e:
         return label, None, str(e)
 
 
+async def fetch_all_app_metadata(urls: Mapping[str, str]) -> List[Tuple[str, Optional[AppMetadata], Optional[str]]]:
+    """Fetch every channel manifest concurrently over one pooled client.
+
+    Results come back in the input order; per-channel failures surface in the
+    error slot of each tuple rather than cancelling the group.
+    """
+    async with app_manifest_client() as client:
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(fetch_app_metadata(client, label, url)) for label, url in urls.items()]
+    return [task.result() for task in tasks]
+
+
 def display_app_metadata(results: List[Tuple[str, Optional[AppMetadata], Optional[str]]]) -> None:
-    console = Console()
     table = Table(title="Opentrons App YAML Manifests", box=box.SIMPLE_HEAVY)
     table.add_column("Channel", style="cyan", no_wrap=True)
     table.add_column("Version", style="green")
@@ -70,7 +225,7 @@ def display_app_metadata(results: List[Tuple[str, Optional[AppMetadata], Optiona
             table.add_row(label, "ERROR", "-", "[red]missing metadata[/red]")
         else:
             if meta.releaseDate:
-                utc = datetime.fromisoformat(meta.releaseDate.replace("Z", "+00:00"))
+                utc = datetime.fromisoformat(meta.releaseDate)
                 local = utc.astimezone()
                 ds = local.strftime("%Y-%m-%d %H:%M:%S %Z")
             else:
@@ -9,14 +9,15 @@ import re
 import webbrowser
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple
 
 import httpx
 import semver
-import yaml
 
+from automation.app_manifest import app_manifest_client, top_level_scalars
 from automation.asset_urls import APP_CHANNEL_YAMLS, AssetChannel, app_manifest_url, app_yaml_url, robot_manifest_url
 from automation.go import decode_ot2_external_version, decode_ot2_internal_version
 from automation.release import robot_manifest_production_entries, robot_manifest_release_keys
@@ -132,6 +133,33 @@ _OT2_SCHEME_LEGACY = 1
 _OT2_SCHEME_UNKNOWN = 0
 
 
+# Releases rank above any prerelease of the same base in semver precedence.
+_SEMVER_RELEASE_RANK = (1,)
+
+
+@lru_cache(maxsize=None)
+def semver_sort_key(clean: str) -> Tuple[Any, ...]:
+    """Return a tuple comparison key ordered by semver precedence.
+
+    Plain X.Y.Z strings skip semver.VersionInfo construction entirely, which
+    is the common case across inventory pages; prerelease and build-metadata
+    versions fall back to the full parser.
+    """
+    if "-" not in clean and "+" not in clean:
+        try:
+            major, minor, patch = clean.split(".")
+            return (int(major), int(minor), int(patch), _SEMVER_RELEASE_RANK)
+        except ValueError:
+            pass
+    parsed = semver.VersionInfo.parse(clean)
+    if not parsed.prerelease:
+        return (parsed.major, parsed.minor, parsed.patch, _SEMVER_RELEASE_RANK)
+    identifiers = tuple(
+        (0, int(part)) if part.isdigit() else (1, part) for part in parsed.prerelease.split(".")
+    )
+    return (parsed.major, parsed.minor, parsed.patch, (0, identifiers))
+
+
 def _ot2_stability_rank(prerelease: Optional[str]) -> int:
     """Rank stability for newest-first sorting: stable above beta above alpha."""
     return {"alpha": 1, "beta": 2}.get(prerelease or "", 3)
@@ -170,23 +198,22 @@ def ot2_version_sort_key(version: str) -> Tuple[Any, ...]:
         yy, month, patch, sub_build = dot_match.groups()
         return (_OT2_SCHEME_DEV, int(yy), int(month), int(patch), 0, int(sub_build))
     try:
-        parsed = semver.VersionInfo.parse(clean)
-        return (_OT2_SCHEME_LEGACY, parsed)
+        return (_OT2_SCHEME_LEGACY, semver_sort_key(clean))
     except ValueError:
         return (_OT2_SCHEME_UNKNOWN, clean)
 
 
 def sort_semver_versions_desc(versions: Sequence[str]) -> List[str]:
     """Return semver versions sorted newest first using semver precedence rules."""
-    parsed: List[Tuple[bool, semver.VersionInfo | str, str]] = []
+    parsed: List[Tuple[bool, Tuple[Any, ...] | str, str]] = []
     for version in versions:
         clean = version.lstrip("v")
         try:
-            parsed.append((True, semver.VersionInfo.parse(clean), version))
+            parsed.append((True, semver_sort_key(clean), version))
         except ValueError:
             parsed.append((False, clean, version))
 
-    def sort_key(item: Tuple[bool, semver.VersionInfo | str, str]) -> Tuple[bool, Any]:
+    def sort_key(item: Tuple[bool, Tuple[Any, ...] | str, str]) -> Tuple[bool, Any]:
         is_semver, value, _raw = item
         return (is_semver, value)
 
@@ -253,13 +280,13 @@ async def fetch_yaml_channel(
         if response.status_code == 404:
             return AppYamlChannel(name=filename, url=url, error="not published")
         response.raise_for_status()
-        data = yaml.safe_load(response.text) or {}
+        data = top_level_scalars(response.content, ("version", "releaseDate", "path"))
         return AppYamlChannel(
             name=filename,
             url=url,
-            version=str(data.get("version", "")) or None,
+            version=data.get("version") or None,
             release_date=data.get("releaseDate"),
-            artifact=str(data.get("path", "")) or None,
+            artifact=data.get("path") or None,
         )
     except Exception as exc:  # noqa: BLE001
         return AppYamlChannel(name=filename, url=url, error=str(exc))
@@ -748,7 +775,7 @@ def render_html(
 
 async def collect_snapshots(config: ReleasePlatformConfig, limit: int) -> List[ChannelSnapshot]:
     """Fetch all channel snapshots concurrently."""
-    async with httpx.AsyncClient(follow_redirects=True) as client:
+    async with app_manifest_client() as client:
         return list(
             await asyncio.gather(*[fetch_channel_snapshot(client, channel, config, limit) for channel in config.channels])
         )
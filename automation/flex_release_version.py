@@ -5,8 +5,6 @@ from __future__ import annotations
 import re
 from typing import Iterable, Optional
 
-import semver
-
 CHORE_RELEASE_BRANCH_RE = re.compile(r"^chore_release-(?P<version>\d+\.\d+\.\d+)$")
 FLEX_APP_TAG_BASE_RE = re.compile(r"^v(?P<version>\d+\.\d+\.\d+)(?:-alpha\.\d+)?$")
 FLEX_INTERNAL_APP_TAG_BASE_RE = re.compile(r"^ot3@(?P<version>\d+\.\d+\.\d+)(?:-(?:alpha|beta)\.\d+)?$")
@@ -20,46 +18,53 @@ def parse_chore_release_version(branch_name: str) -> Optional[str]:
     return match.group("version")
 
 
+def _base_version_key(raw: str) -> tuple[int, int, int]:
+    """Return the (major, minor, patch) comparison key for a strict X.Y.Z string.
+
+    The match patterns above guarantee three dotted integer parts, so there is
+    no need to build semver.VersionInfo objects just to compare bases.
+    """
+    major, minor, patch = raw.split(".")
+    return (int(major), int(minor), int(patch))
+
+
 def highest_chore_release_version(branch_names: Iterable[str]) -> Optional[str]:
     """Return the highest semver among strict chore_release-X.Y.Z branch names."""
-    versions: list[semver.VersionInfo] = []
+    versions: list[tuple[int, int, int]] = []
     for name in branch_names:
         raw = parse_chore_release_version(name)
         if raw is None:
             continue
-        versions.append(semver.VersionInfo.parse(raw))
+        versions.append(_base_version_key(raw))
     if not versions:
         return None
-    highest = max(versions, key=lambda version: (version.major, version.minor, version.patch))
-    return str(highest)
+    return "{}.{}.{}".format(*max(versions))
 
 
 def flex_base_from_app_tags(tags: Iterable[str]) -> Optional[str]:
     """Return the highest vX.Y.Z base seen in Flex external app tags."""
-    versions: list[semver.VersionInfo] = []
+    versions: list[tuple[int, int, int]] = []
     for tag in tags:
         match = FLEX_APP_TAG_BASE_RE.match(tag)
         if match is None:
             continue
-        versions.append(semver.VersionInfo.parse(match.group("version")))
+        versions.append(_base_version_key(match.group("version")))
     if not versions:
         return None
-    highest = max(versions, key=lambda version: (version.major, version.minor, version.patch))
-    return str(highest)
+    return "{}.{}.{}".format(*max(versions))
 
 
 def flex_base_from_internal_app_tags(tags: Iterable[str]) -> Optional[str]:
     """Return the highest X.Y.Z base seen in Flex internal ot3@ app tags."""
-    versions: list[semver.VersionInfo] = []
+    versions: list[tuple[int, int, int]] = []
     for tag in tags:
         match = FLEX_INTERNAL_APP_TAG_BASE_RE.match(tag)
         if match is None:
             continue
-        versions.append(semver.VersionInfo.parse(match.group("version")))
+        versions.append(_base_version_key(match.group("version")))
     if not versions:
         return None
-    highest = max(versions, key=lambda version: (version.major, version.minor, version.patch))
-    return str(highest)
+    return "{}.{}.{}".format(*max(versions))
 
 
 def flex_external_default_release_version(
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import os
 import re
 import subprocess
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, cast
 
@@ -55,7 +57,7 @@ console = Console(log_time=False)
 # ------------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(frozen=True)
 class RepoSpec:
     name: str
     repo_url: str
@@ -107,9 +109,14 @@ def strip_tag_version(tag: str) -> str:
     return tag
 
 
+@lru_cache(maxsize=None)
 def chore_release_branch(version: str) -> str:
-    """Return the chore_release branch name for a release version."""
-    return f"chore_release-{version.lstrip('v')}"
+    """Return the chore_release branch name for a release version.
+
+    Cached: the same version string is resolved once per repo per table, so
+    repeated string builds collapse to one dict lookup.
+    """
+    return f"chore_release-{version.removeprefix('v')}"
 
 
 def release_on_default_branch(
@@ -182,51 +189,125 @@ def branches_to_sync(
 # ------------------------------------------------------------------------------
 
 
+def _git_env() -> Dict[str, str]:
+    """Environment for git subprocesses: no optional locks, pager, or credential prompts."""
+    return {**os.environ, "GIT_OPTIONAL_LOCKS": "0", "GIT_TERMINAL_PROMPT": "0"}
+
+
 def run_git_command(args: List[str], cwd: Optional[Path] = None) -> str:
     """Run a git command and return its stdout, or raise on error."""
-    result = subprocess.run(["git", *args], cwd=cwd, text=True, capture_output=True)
+    result = subprocess.run(
+        ["git", "--no-pager", *args], cwd=cwd, env=_git_env(), text=True, capture_output=True
+    )
     if result.returncode:
         raise RuntimeError(f"Git failed: {' '.join(args)}\n{result.stderr}")
     return result.stdout.strip()
 
 
-def branch_exists(repo_url: str, branch_name: str) -> bool:
-    """Check if a given branch exists on the remote."""
-    try:
-        out = run_git_command(["ls-remote", "--heads", repo_url, f"refs/heads/{branch_name}"])
-        return bool(out)
-    except RuntimeError:
-        return False
+async def run_git(args: List[str], cwd: Optional[Path] = None, capture: bool = True) -> str:
+    """Run a git command without blocking the event loop and return its stdout.
 
+    Pass ``capture=False`` for side-effect commands (clone, fetch, checkout):
+    stdout goes to /dev/null so nothing is piped or decoded. stderr is always
+    captured for error reporting.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        "git",
+        "--no-pager",
+        *args,
+        cwd=cwd,
+        env=_git_env(),
+        stdout=asyncio.subprocess.PIPE if capture else asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await proc.communicate()
+    if proc.returncode:
+        raise RuntimeError(f"Git failed: {' '.join(args)}\n{stderr.decode()}")
+    return stdout.decode().strip() if capture else ""
+
+
+async def list_all_tags(local_path: Path) -> List[str]:
+    """Return every tag name in one call, newest creatordate first."""
+    out = await run_git(
+        ["for-each-ref", "refs/tags", "--sort=-creatordate", "--format=%(refname:short)"],
+        cwd=local_path,
+    )
+    return out.splitlines()
 
-def remote_branch_names(repo_url: str) -> List[str]:
-    """Return remote branch names from a git repository URL."""
-    try:
-        lines = run_git_command(["ls-remote", "--heads", repo_url]).splitlines()
-    except RuntimeError:
-        return []
 
+# Remote branch heads cached per repo URL for the lifetime of the run. A failed
+# ls-remote caches as empty so one unreachable remote costs a single network
+# round trip. Protocol v2 sends --heads as a ref-prefix filter, so the server
+# never advertises tags or PR refs.
+_remote_heads_cache: Dict[str, Tuple[str, ...]] = {}
+
+_LS_REMOTE_HEADS_ARGS = ["-c", "protocol.version=2", "ls-remote", "--heads"]
+
+
+def _parse_remote_heads(output: str) -> Tuple[str, ...]:
+    """Extract branch names from ls-remote --heads output."""
     names: List[str] = []
-    for line in lines:
+    for line in output.splitlines():
         if not line:
             continue
         _commit, ref = line.split("\t", maxsplit=1)
         if ref.startswith("refs/heads/"):
             names.append(ref.removeprefix("refs/heads/"))
+    return tuple(names)
+
+
+async def fetch_remote_head_names(repo_url: str) -> Tuple[str, ...]:
+    """Fetch and cache remote branch heads without blocking the event loop."""
+    cached = _remote_heads_cache.get(repo_url)
+    if cached is not None:
+        return cached
+    try:
+        out = await run_git([*_LS_REMOTE_HEADS_ARGS, repo_url])
+    except RuntimeError:
+        out = ""
+    names = _parse_remote_heads(out)
+    _remote_heads_cache[repo_url] = names
+    return names
+
+
+def _remote_head_names(repo_url: str) -> Tuple[str, ...]:
+    """Return cached remote branch heads, fetching synchronously on a cold cache."""
+    cached = _remote_heads_cache.get(repo_url)
+    if cached is not None:
+        return cached
+    try:
+        out = run_git_command([*_LS_REMOTE_HEADS_ARGS, repo_url])
+    except RuntimeError:
+        out = ""
+    names = _parse_remote_heads(out)
+    _remote_heads_cache[repo_url] = names
     return names
 
 
+def branch_exists(repo_url: str, branch_name: str) -> bool:
+    """Check if a given branch exists on the remote."""
+    return branch_name in _remote_head_names(repo_url)
+
+
+def remote_branch_names(repo_url: str) -> List[str]:
+    """Return remote branch names from a git repository URL."""
+    return list(_remote_head_names(repo_url))
+
+
 def local_branch_names(repo: RepoSpec) -> List[str]:
     """Return local and remote-tracking branch names when the repo is cloned."""
     if not (repo.local_path / ".git").exists():
         return []
 
+    out = run_git_command(
+        ["for-each-ref", "--format=%(refname:short)", "refs/heads", "refs/remotes/origin"],
+        cwd=repo.local_path,
+    )
     names: List[str] = []
-    for line in run_git_command(["branch", "-a"], cwd=repo.local_path).splitlines():
-        branch = line.strip().strip("* ").strip()
-        if branch.startswith("remotes/origin/"):
-            branch = branch.removeprefix("remotes/origin/")
-        if branch in {"HEAD", "origin"} or "->" in branch:
+    for branch in out.splitlines():
+        if branch.startswith("origin/"):
+            branch = branch.removeprefix("origin/")
+        if branch in {"HEAD", "origin"}:
             continue
         names.append(branch)
     return names
@@ -287,7 +368,7 @@ def infer_flex_default_release_version(release_type: str) -> Optional[str]:
 # ------------------------------------------------------------------------------
 
 
-def process_repo(
+async def process_repo(
     repo: RepoSpec,
     version: str,
     release_path: ReleasePath,
@@ -297,42 +378,40 @@ def process_repo(
     """Clone or fetch the repo, checkout branches, and collect tags."""
     # clone or fetch
     if not (repo.local_path / ".git").exists():
-        run_git_command(["clone", repo.repo_url, str(repo.local_path)])
+        # Blobless partial clone: full commit/tag history for --merged queries,
+        # file contents fetched lazily on checkout.
+        await run_git(["clone", "--filter=blob:none", repo.repo_url, str(repo.local_path)], capture=False)
     else:
-        run_git_command(["fetch", "--all"], cwd=repo.local_path)
+        await run_git(
+            ["fetch", "--prune", "--tags", "--filter=blob:none", "origin"],
+            cwd=repo.local_path,
+            capture=False,
+        )
 
-    # checkout branches
+    # checkout branches at the just-fetched remote tips; no per-branch pull needed
     branches = branches_to_sync(repo, version, release_path, release_type, branch_config)
     for br in branches:
-        existing = [b.strip("* ").strip() for b in run_git_command(["branch"], cwd=repo.local_path).splitlines()]
-        if br not in existing:
-            run_git_command(["checkout", "-B", br, f"origin/{br}"], cwd=repo.local_path)
-        else:
-            run_git_command(["checkout", br], cwd=repo.local_path)
-            run_git_command(["pull"], cwd=repo.local_path)
+        await run_git(["checkout", "-B", br, f"origin/{br}"], cwd=repo.local_path, capture=False)
 
-    # collect tags
+    # collect tags: one full listing plus one --merged set per branch, filtered in Python
     state = RepoState()
     patterns = [repo.external_tag_pattern, repo.internal_tag_pattern]
     channel_pattern = repo.external_tag_pattern if release_type == "external" else repo.internal_tag_pattern
+    all_tags = await list_all_tags(repo.local_path)
 
     for br in branches:
-        state.branch_tags[br] = {
-            pat: run_git_command(
-                ["tag", "-l", f"{pat}*", "--merged", br, "--sort=-creatordate"],
-                cwd=repo.local_path,
-            ).splitlines()[:7]
-            for pat in patterns
-        }
+        merged = set((await run_git(["tag", "--merged", br], cwd=repo.local_path)).splitlines())
+        state.branch_tags[br] = {pat: [tag for tag in all_tags if tag.startswith(pat) and tag in merged][:7] for pat in patterns}
 
     for pat in patterns:
-        tags = run_git_command(["tag", "-l", f"{pat}*", "--sort=-creatordate"], cwd=repo.local_path).splitlines()
-        state.overall_tags[pat] = tags[0] if tags else None
+        state.overall_tags[pat] = next((tag for tag in all_tags if tag.startswith(pat)), None)
 
     if repo.name == release_path.taggable_repo:
-        state.channel_tags = run_git_command(
-            ["tag", "-l", f"{channel_pattern}*", "--sort=-v:refname"],
-            cwd=repo.local_path,
+        state.channel_tags = (
+            await run_git(
+                ["tag", "-l", f"{channel_pattern}*", "--sort=-v:refname"],
+                cwd=repo.local_path,
+            )
         ).splitlines()
 
     return state
@@ -476,6 +555,17 @@ def tag_commit(repo: RepoSpec, tag: str) -> str:
     return run_git_command(["rev-list", "-n", "1", tag], cwd=repo.local_path)
 
 
+def branch_and_tag_commits(repo: RepoSpec, branch: str, tag: str) -> Tuple[str, str]:
+    """Return (branch HEAD, tag target commit) from a single git invocation.
+
+    ``<tag>^{commit}`` peels annotated tags, so one rev-parse replaces a
+    rev-parse plus rev-list pair per comparison.
+    """
+    out = run_git_command(["rev-parse", branch, f"{tag}^{{commit}}"], cwd=repo.local_path)
+    head, tagc = out.splitlines()
+    return head, tagc
+
+
 def latest_channel_tag(state: RepoState, repo: RepoSpec, branch: str, release_type: str) -> Optional[str]:
     """Return the newest tag on branch for the selected release channel."""
     pattern = repo.external_tag_pattern if release_type == "external" else repo.internal_tag_pattern
@@ -487,7 +577,8 @@ def needs_new_tag(repo: RepoSpec, branch: str, latest_tag: Optional[str]) -> boo
     """Return True when branch HEAD is ahead of the latest channel tag."""
     if latest_tag is None:
         return True
-    return branch_head_commit(repo, branch) != tag_commit(repo, latest_tag)
+    head, tagc = branch_and_tag_commits(repo, branch, latest_tag)
+    return head != tagc
 
 
 def tags_merged_on_branch(state: RepoState, branch: str) -> List[str]:
@@ -556,9 +647,10 @@ def semver_base_from_tag(tag: str) -> str:
     return match.group(1)
 
 
+@lru_cache(maxsize=None)
 def flex_release_semver_base(version: str) -> str:
     """Normalize the prompted Flex base version to X.Y.Z semver."""
-    clean = version.lstrip("v")
+    clean = version.removeprefix("v")
     match = SEMVER_BASE_RE.match(clean)
     if match is None:
         raise ValueError(f"Invalid Flex base version: {version}")
@@ -865,14 +957,16 @@ def get_flex_coordinated_stack_tag_plan(
         base,
     )
     tag_exists = coordinated in merged_tags
-    if tag_exists and branch_head_commit(repo, branch) == tag_commit(repo, coordinated):
-        return TagPlan(
-            needs_tag=False,
-            latest_tag=coordinated,
-            next_tag=None,
-            branch=branch,
-            reason=f"{branch} already at coordinated tag {coordinated}",
-        )
+    if tag_exists:
+        head, tagc = branch_and_tag_commits(repo, branch, coordinated)
+        if head == tagc:
+            return TagPlan(
+                needs_tag=False,
+                latest_tag=coordinated,
+                next_tag=None,
+                branch=branch,
+                reason=f"{branch} already at coordinated tag {coordinated}",
+            )
 
     if tag_exists:
         reason = f"commits on {branch} since {coordinated}"
@@ -1171,53 +1265,7 @@ def get_next_tag_command(
 # ------------------------------------------------------------------------------
 
 
-def print_external_table(
-    results: Dict[str, RepoState],
-    repos: List[RepoSpec],
-    version: str,
-    release_path: ReleasePath,
-    release_type: str,
-    stability: str,
-    branch_config: Optional[ReleaseBranchConfig] = None,
-) -> None:
-    """Print a table of external compare URLs, using chore_release branch if present."""
-    tbl = Table(title="External GitHub Compare URLs")
-    tbl.add_column("Repo", style="bold")
-    tbl.add_column("Compare", no_wrap=True)
-
-    for repo in repos:
-        st = results.get(repo.name)
-        if not st:
-            continue
-
-        branch = release_branch_for_repo(st, repo, version, release_path, release_type, branch_config)
-        if repo.name == release_path.taggable_repo:
-            tag = compare_tag_for_app_release(
-                release_path,
-                results,
-                version,
-                release_type,
-                stability,
-                branch,
-            )
-        else:
-            pat = repo.external_tag_pattern
-            tags = st.branch_tags[branch].get(pat, [])
-            tag = tags[0] if tags else None
-        base = repo.repo_url.removesuffix(".git")
-
-        if tag:
-            url = f"{base}/compare/{tag}...{branch}"
-            link = Text(url, style=f"link {url}")
-        else:
-            link = Text("None", style="italic")
-
-        tbl.add_row(repo.name, link)
-
-    console.print(tbl)
-
-
-def print_internal_table(
+def print_compare_table(
     results: Dict[str, RepoState],
     repos: List[RepoSpec],
     version: str,
@@ -1226,8 +1274,8 @@ def print_internal_table(
     stability: str,
     branch_config: Optional[ReleaseBranchConfig] = None,
 ) -> None:
-    """Print a table of internal compare URLs for the release branch."""
-    tbl = Table(title="Internal GitHub Compare URLs")
+    """Print a table of GitHub compare URLs for the selected release channel."""
+    tbl = Table(title=f"{release_type.capitalize()} GitHub Compare URLs")
     tbl.add_column("Repo", style="bold")
     tbl.add_column("Compare", no_wrap=True)
 
@@ -1247,7 +1295,7 @@ def print_internal_table(
                 branch,
             )
         else:
-            pat = repo.internal_tag_pattern
+            pat = repo.external_tag_pattern if release_type == "external" else repo.internal_tag_pattern
             tags = st.branch_tags[branch].get(pat, [])
             tag = tags[0] if tags else None
         base = repo.repo_url.removesuffix(".git")
@@ -1271,8 +1319,7 @@ def print_internal_table(
 def show_changes_since_tag(repo: RepoSpec, branch: str, tag: str) -> None:
     """Print last 20 commits since <tag> on <branch>, or note none."""
     lp = repo.local_path
-    head = run_git_command(["rev-parse", branch], cwd=lp)
-    tagc = run_git_command(["rev-list", "-n", "1", tag], cwd=lp)
+    head, tagc = branch_and_tag_commits(repo, branch, tag)
 
     if head == tagc:
         console.print(f"[yellow]No changes in {repo.name} since {tag} on {branch}[/]")
@@ -1337,6 +1384,9 @@ repos: List[RepoSpec] = [
     ),
 ]
 
+# Reverse index so name lookups never rescan the manifest list.
+repos_by_name: Dict[str, RepoSpec] = {repo.name: repo for repo in repos}
+
 
 @dataclass(frozen=True)
 class ReleasePath:
@@ -1628,10 +1678,10 @@ def print_assumptions_panel() -> None:
 
 def repo_by_name(name: str) -> RepoSpec:
     """Return the RepoSpec for a known repo name."""
-    for repo in repos:
-        if repo.name == name:
-            return repo
-    raise KeyError(f"Unknown repo: {name}")
+    try:
+        return repos_by_name[name]
+    except KeyError:
+        raise KeyError(f"Unknown repo: {name}") from None
 
 
 def app_stability_latest_tags(
@@ -2014,16 +2064,28 @@ def sync_release_repos(
     """Clone or pull stack repos and return synced tag state."""
     sync_repos = repos_to_sync(release_path)
 
+    async def _sync_all() -> Dict[str, RepoState | BaseException]:
+        # Warm the remote-heads cache concurrently so branch_exists answers
+        # from cache inside every process_repo instead of blocking the loop
+        # on an ls-remote round trip.
+        await asyncio.gather(*(fetch_remote_head_names(r.repo_url) for r in sync_repos))
+        outcomes = await asyncio.gather(
+            *(process_repo(r, version, release_path, release_type, branch_config) for r in sync_repos),
+            return_exceptions=True,
+        )
+        return dict(zip([r.name for r in sync_repos], outcomes))
+
     results: Dict[str, RepoState] = {}
-    with ThreadPoolExecutor() as executor:
-        futures = {executor.submit(process_repo, r, version, release_path, release_type, branch_config): r for r in sync_repos}
-        for future in as_completed(futures):
-            repo = futures[future]
-            try:
-                results[repo.name] = future.result()
-                console.log(f"[green]✅ {repo.name} synced[/]")
-            except Exception as err:
-                console.log(f"[red]❌ {repo.name} failed: {err}[/]")
+    status_lines: List[str] = []
+    for name, outcome in asyncio.run(_sync_all()).items():
+        if isinstance(outcome, BaseException):
+            status_lines.append(f"[red]❌ {name} failed: {outcome}[/]")
+        else:
+            results[name] = outcome
+            status_lines.append(f"[green]✅ {name} synced[/]")
+
+    # One render call for the whole sync phase instead of a log line per repo.
+    console.print("\n".join(status_lines))
 
     return results
 
@@ -2150,26 +2212,15 @@ def run_release(
         branch_config,
     )
 
-    if release_type == "external":
-        print_external_table(
-            results,
-            active_repos,
-            version,
-            release_path,
-            release_type,
-            stability,
-            branch_config,
-        )
-    else:
-        print_internal_table(
-            results,
-            active_repos,
-            version,
-            release_path,
-            release_type,
-            stability,
-            branch_config,
-        )
+    print_compare_table(
+        results,
+        active_repos,
+        version,
+        release_path,
+        release_type,
+        stability,
+        branch_config,
+    )
 
     print_tag_push_order_note(
         release_path,
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any, Dict, List, Optional
 
 import semver
@@ -75,15 +76,20 @@ class RobotRelease:
     version_url: str
     release_notes: str
 
+    @cached_property
+    def version_info(self) -> semver.VersionInfo:
+        """Parsed semver for this release, computed once per instance."""
+        return semver.VersionInfo.parse(self.version)
 
-@dataclass
+
+@dataclass(slots=True)
 class AppFile:
     url: str
     sha512: str
     size: int
 
 
-@dataclass
+@dataclass(slots=True)
 class AppMetadata:
     version: str
     files: List[AppFile]
@@ -92,6 +98,23 @@ class AppMetadata:
     releaseNotes: str
     releaseDate: Optional[str] = None
 
+    @classmethod
+    def from_manifest(cls, data: Dict[str, Any]) -> "AppMetadata":
+        """Build metadata from a parsed updater manifest in one pass, ignoring extra file fields."""
+        files = [
+            AppFile(url=f["url"], sha512=f["sha512"], size=f["size"])
+            for f in data.get("files", [])
+            if "url" in f and "sha512" in f and "size" in f
+        ]
+        return cls(
+            version=data["version"],
+            files=files,
+            path=data["path"],
+            sha512=data["sha512"],
+            releaseNotes=data.get("releaseNotes", ""),
+            releaseDate=data.get("releaseDate"),
+        )
+
 
 @dataclass
 class RobotReleasesCollection:
@@ -110,7 +133,7 @@ class RobotReleasesCollection:
                 version_url=info["version"],
                 release_notes=info["releaseNotes"],
             )
-            vi = semver.VersionInfo.parse(ver)
+            vi = rel.version_info
             if vi.prerelease:
                 tag = vi.prerelease.split(".")[0]
                 if tag == "alpha":
@@ -124,14 +147,14 @@ class RobotReleasesCollection:
     def latest_alpha(self) -> Optional[RobotRelease]:
         if not self.alphas:
             return None
-        return max(self.alphas, key=lambda r: semver.VersionInfo.parse(r.version))
+        return max(self.alphas, key=lambda r: r.version_info)
 
     def latest_beta(self) -> Optional[RobotRelease]:
         if not self.betas:
             return None
-        return max(self.betas, key=lambda r: semver.VersionInfo.parse(r.version))
+        return max(self.betas, key=lambda r: r.version_info)
 
     def latest_stable(self) -> Optional[RobotRelease]:
         if not self.stables:
             return None
-        return max(self.stables, key=lambda r: semver.VersionInfo.parse(r.version))
+        return max(self.stables, key=lambda r: r.version_info)
@@ -18,6 +18,7 @@ import yaml
 from rich.console import Console
 from rich.table import Table
 
+from automation.app_manifest import SafeLoader
 from automation.asset_inventory import ReleasePlatformConfig
 from automation.asset_urls import AssetChannel, app_manifest_url, app_yaml_url, robot_manifest_url
 from automation.cloudfront_invalidation import RobotPath, release_channel_from_tag, resolve_release_tag
@@ -135,7 +136,7 @@ async def fetch_yaml_version(client: httpx.AsyncClient, url: str) -> Optional[st
     if response.status_code == 404:
         return None
     response.raise_for_status()
-    data = yaml.safe_load(response.text) or {}
+    data = yaml.load(response.content, Loader=SafeLoader) or {}
     if not isinstance(data, dict):
         return None
     version = data.get("version")
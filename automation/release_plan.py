@@ -18,6 +18,7 @@ import yaml
 from rich.console import Console
 from rich.panel import Panel
 
+from automation.app_manifest import SafeLoader
 from automation.release_branch_config import ReleaseBranchConfig
 
 PLAN_SCHEMA_VERSION = 1
@@ -582,7 +583,7 @@ def load_release_plan(plan_path: Path) -> ReleasePlan:
     text = plan_path.read_text(encoding="utf-8")
     if text.startswith("#"):
         text = "\n".join(line for line in text.splitlines() if not line.startswith("#"))
-    data = yaml.safe_load(text)
+    data = yaml.load(text, Loader=SafeLoader)
     if not isinstance(data, dict):
         raise ValueError(f"Invalid plan file: {plan_path}")
     return release_plan_from_dict(data, plan_path=plan_path)
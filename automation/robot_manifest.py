@@ -1,19 +1,17 @@
 from typing import Optional, Tuple
 
 import httpx
-from rich.console import Console
 
+from automation.app_manifest import get_with_retries
 from automation.release import RobotReleasesCollection, robot_manifest_production_entries
 
-console: Console = Console()
-
 
 async def fetch_robot_releases(
     client: httpx.AsyncClient, label: str, url: str
 ) -> Tuple[str, Optional[RobotReleasesCollection], Optional[str]]:
     """Download JSON metadata and wrap grouped releases in RobotReleasesCollection."""
     try:
-        r: httpx.Response = await client.get(url, timeout=10.0)
+        r: httpx.Response = await get_with_retries(client, url)
         r.raise_for_status()
         prod = robot_manifest_production_entries(r.json())
         if not prod:
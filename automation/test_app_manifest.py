@@ -0,0 +1,173 @@
+"""Tests for app manifest fetching and parsing helpers."""
+
+from __future__ import annotations
+
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+import httpx
+
+from automation import app_manifest
+from automation.app_manifest import get_manifest_body, get_with_retries, top_level_scalars
+from automation.release import AppMetadata
+
+CHANNEL_YAML = """\
+version: 8.5.0
+files:
+  - url: Opentrons-v8.5.0-mac-b100.dmg
+    sha512: abc
+    size: 123
+  - url: Opentrons-v8.5.0-win-b100.exe
+    sha512: def
+    size: 456
+path: Opentrons-v8.5.0-mac-b100.dmg
+sha512: abc
+releaseDate: '2026-08-01T12:00:00.000Z'
+"""
+
+
+class TopLevelScalarsTests(unittest.TestCase):
+    def test_extracts_header_fields_past_nested_files(self) -> None:
+        found = top_level_scalars(CHANNEL_YAML, ("version", "releaseDate", "path"))
+        self.assertEqual(
+            found,
+            {
+                "version": "8.5.0",
+                "releaseDate": "2026-08-01T12:00:00.000Z",
+                "path": "Opentrons-v8.5.0-mac-b100.dmg",
+            },
+        )
+
+    def test_missing_wanted_key_is_absent(self) -> None:
+        found = top_level_scalars("version: 8.5.0\n", ("version", "releaseDate"))
+        self.assertEqual(found, {"version": "8.5.0"})
+
+    def test_nested_scalars_do_not_shadow_top_level_keys(self) -> None:
+        doc = "files:\n  version: nested\npath: top\n"
+        found = top_level_scalars(doc, ("version", "path"))
+        self.assertEqual(found, {"path": "top"})
+
+    def test_alias_values_do_not_mis_pair_later_keys(self) -> None:
+        doc = "path: &p latest.dmg\nreleaseDate: *p\nversion: 8.5.0\n"
+        found = top_level_scalars(doc, ("version", "releaseDate", "path"))
+        self.assertEqual(found, {"path": "latest.dmg", "version": "8.5.0"})
+
+    def test_accepts_bytes(self) -> None:
+        found = top_level_scalars(b"version: 8.5.0\n", ("version",))
+        self.assertEqual(found, {"version": "8.5.0"})
+
+
+class FromManifestTests(unittest.TestCase):
+    def test_builds_metadata_and_ignores_extra_file_fields(self) -> None:
+        data = {
+            "version": "8.5.0",
+            "files": [
+                {"url": "a.dmg", "sha512": "abc", "size": 1, "blockMapSize": 99},
+                {"url": "b.exe", "sha512": "def", "size": 2},
+            ],
+            "path": "a.dmg",
+            "sha512": "abc",
+            "releaseNotes": "notes",
+            "releaseDate": "2026-08-01T12:00:00.000Z",
+        }
+        meta = AppMetadata.from_manifest(data)
+        self.assertEqual(meta.version, "8.5.0")
+        self.assertEqual([f.url for f in meta.files], ["a.dmg", "b.exe"])
+        self.assertEqual(meta.files[0].size, 1)
+        self.assertEqual(meta.releaseDate, "2026-08-01T12:00:00.000Z")
+
+    def test_optional_fields_default(self) -> None:
+        meta = AppMetadata.from_manifest({"version": "8.5.0", "path": "a.dmg", "sha512": "abc"})
+        self.assertEqual(meta.files, [])
+        self.assertEqual(meta.releaseNotes, "")
+        self.assertIsNone(meta.releaseDate)
+
+    def test_skips_files_missing_required_fields(self) -> None:
+        data = {
+            "version": "8.5.0",
+            "files": [{"url": "a.dmg", "sha512": "abc", "size": 1}, {"url": "no-hash.exe"}],
+            "path": "a.dmg",
+            "sha512": "abc",
+        }
+        meta = AppMetadata.from_manifest(data)
+        self.assertEqual([f.url for f in meta.files], ["a.dmg"])
+
+
+class GetWithRetriesTests(unittest.IsolatedAsyncioTestCase):
+    async def test_retries_5xx_then_returns_success(self) -> None:
+        statuses = [503, 200]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(statuses.pop(0))
+
+        with patch.object(app_manifest, "RETRY_BASE_DELAY", 0):
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                response = await get_with_retries(client, "https://example.test/latest.yml")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(statuses, [])
+
+    async def test_returns_last_5xx_when_attempts_exhausted(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(502)
+
+        with patch.object(app_manifest, "RETRY_BASE_DELAY", 0):
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                response = await get_with_retries(client, "https://example.test/latest.yml", attempts=2)
+        self.assertEqual(response.status_code, 502)
+
+    async def test_raises_transport_error_when_attempts_exhausted(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused")
+
+        with patch.object(app_manifest, "RETRY_BASE_DELAY", 0):
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                with self.assertRaises(httpx.ConnectError):
+                    await get_with_retries(client, "https://example.test/latest.yml", attempts=2)
+
+
+class GetManifestBodyTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self._tmp = TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        patcher = patch.object(app_manifest, "MANIFEST_CACHE_DIR", Path(self._tmp.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        app_manifest._manifest_cache.clear()
+        self.addCleanup(app_manifest._manifest_cache.clear)
+
+    async def test_304_reuses_cached_body(self) -> None:
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.headers.get("If-None-Match") == '"tag-1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=b"version: 8.5.0\n", headers={"ETag": '"tag-1"'})
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            first = await get_manifest_body(client, "https://example.test/latest.yml")
+            second = await get_manifest_body(client, "https://example.test/latest.yml")
+        self.assertEqual(first, b"version: 8.5.0\n")
+        self.assertEqual(second, b"version: 8.5.0\n")
+        self.assertNotIn("If-None-Match", requests[0].headers)
+        self.assertEqual(requests[1].headers["If-None-Match"], '"tag-1"')
+
+    async def test_validators_persist_across_processes(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.headers.get("If-None-Match") == '"tag-1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=b"version: 8.5.0\n", headers={"ETag": '"tag-1"'})
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            await get_manifest_body(client, "https://example.test/latest.yml")
+            # A fresh process starts with an empty in-memory cache but the
+            # same on-disk validators.
+            app_manifest._manifest_cache.clear()
+            body = await get_manifest_body(client, "https://example.test/latest.yml")
+        self.assertEqual(body, b"version: 8.5.0\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
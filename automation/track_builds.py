@@ -182,8 +182,6 @@ def normalize_tag(path: PathConfig, tag: str, release_type: Optional[str]) -> st
 
 def parse_created_at(value: str) -> datetime:
     """Parse GitHub Actions createdAt timestamps."""
-    if value.endswith("Z"):
-        value = f"{value[:-1]}+00:00"
     return datetime.fromisoformat(value)
 
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import os
 import subprocess
 import sys
 from dataclasses import dataclass
@@ -54,8 +55,9 @@ def is_flex_stack_coordination_tag(tag: str) -> bool:
 def run_git(args: Sequence[str], cwd: Path) -> subprocess.CompletedProcess[str]:
     """Run a git command and capture stdout/stderr as text."""
     return subprocess.run(
-        ["git", *args],
+        ["git", "--no-pager", *args],
         cwd=cwd,
+        env={**os.environ, "GIT_OPTIONAL_LOCKS": "0", "GIT_TERMINAL_PROMPT": "0"},
         check=False,
         capture_output=True,
         text=True,